@@ -6,116 +6,109 @@ Manage disk space and organize files
 
 import os
 import sys
+import time
 import argparse
 from pathlib import Path
-from datetime import datetime, timedelta
 import shutil
+import heapq
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 VIDEOS_DIR = Path("videos")
 YOUTUBE_SHORTS_DIR = VIDEOS_DIR / "youtube_shorts"
 INSTA_REELS_DIR = VIDEOS_DIR / "instagram_reels"
+DELETE_WORKERS = 8
 
+# Bound format methods for the per-file listing lines
+_VIDEO_LINE = "  {status}: {name}\n    Age: {age:.1f} hours | Size: {size:.2f} MB".format
+_TEMP_LINE = "  {status}: {name} ({size:.2f} MB)".format
 
-def get_file_size(filepath):
-    """Get file size in MB"""
-    return os.path.getsize(filepath) / (1024 * 1024)
 
+def _iter_videos(dir_path, suffix=".mp4"):
+    """Yield (name, size, mtime) for each file in dir_path with one stat per entry"""
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(suffix):
+                st = entry.stat(follow_symlinks=False)
+                yield entry.name, st.st_size, st.st_mtime
 
-def get_file_age_hours(filepath):
-    """Get file age in hours"""
-    file_time = os.path.getmtime(filepath)
-    current_time = datetime.now().timestamp()
-    return (current_time - file_time) / 3600
 
+def _age_hours(mtime, now):
+    """Age in hours of a file modified at mtime, relative to a shared now"""
+    return (now - mtime) / 3600
 
-def cleanup_youtube_shorts(older_than_hours=24, dry_run=False):
-    """Delete YouTube Shorts videos older than N hours"""
-    
-    if not YOUTUBE_SHORTS_DIR.exists():
-        print("⚠️ YouTube Shorts directory not found")
-        return 0
-    
-    videos = list(YOUTUBE_SHORTS_DIR.glob("*.mp4"))
-    
-    if not videos:
-        print("ℹ️ No YouTube Shorts videos found")
-        return 0
-    
+
+def _delete_all(victims):
+    """Delete (remove_fn, name, size_mb) victims concurrently, return (count, freed MB)"""
     deleted_count = 0
     total_freed = 0
     
-    print(f"📁 YouTube Shorts directory: {YOUTUBE_SHORTS_DIR}")
-    print(f"📋 Found {len(videos)} video(s)")
-    print()
-    
-    for video in sorted(videos):
-        age_hours = get_file_age_hours(video)
-        size_mb = get_file_size(video)
-        
-        if age_hours >= older_than_hours:
-            status = "WILL DELETE" if dry_run else "DELETED"
-            print(f"  {status}: {video.name}")
-            print(f"    Age: {age_hours:.1f} hours | Size: {size_mb:.2f} MB")
-            
-            if not dry_run:
-                try:
-                    os.remove(video)
-                    deleted_count += 1
-                    total_freed += size_mb
-                except Exception as e:
-                    print(f"    ❌ Error: {e}")
-        else:
-            print(f"  KEEP: {video.name}")
-            print(f"    Age: {age_hours:.1f} hours | Size: {size_mb:.2f} MB")
-    
-    print()
-    if dry_run:
-        print(f"🔍 Dry run: Would delete {deleted_count} file(s), freeing {total_freed:.2f} MB")
-    else:
-        print(f"✅ Deleted {deleted_count} file(s), freed {total_freed:.2f} MB")
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        futures = {
+            executor.submit(remove_fn, name): (name, size_mb)
+            for remove_fn, name, size_mb in victims
+        }
+        for future in as_completed(futures):
+            name, size_mb = futures[future]
+            try:
+                future.result()
+                deleted_count += 1
+                total_freed += size_mb
+            except Exception as e:
+                print(f"    ❌ Error deleting {name}: {e}")
     
-    return deleted_count
+    return deleted_count, total_freed
 
 
-def cleanup_instagram_reels(older_than_hours=168, dry_run=False):
-    """Delete Instagram Reels older than N hours (default: 7 days)"""
+def _cleanup_videos(directory, label, older_than_hours, dry_run):
+    """Delete videos in directory older than N hours"""
     
-    if not INSTA_REELS_DIR.exists():
-        print("⚠️ Instagram Reels directory not found")
+    if not directory.exists():
+        print(f"⚠️ {label} directory not found")
         return 0
     
-    videos = list(INSTA_REELS_DIR.glob("*.mp4"))
+    videos = sorted(_iter_videos(directory))
     
     if not videos:
-        print("ℹ️ No Instagram Reels videos found")
+        print(f"ℹ️ No {label} videos found")
         return 0
     
-    deleted_count = 0
-    total_freed = 0
+    victims = []
+    lines = []
+    now = time.time()
     
-    print(f"📁 Instagram Reels directory: {INSTA_REELS_DIR}")
+    print(f"📁 {label} directory: {directory}")
     print(f"📋 Found {len(videos)} video(s)")
     print()
     
-    for video in sorted(videos):
-        age_hours = get_file_age_hours(video)
-        size_mb = get_file_size(video)
+    for name, size, mtime in videos:
+        age_hours = _age_hours(mtime, now)
+        size_mb = size / (1024 * 1024)
         
         if age_hours >= older_than_hours:
             status = "WILL DELETE" if dry_run else "DELETED"
-            print(f"  {status}: {video.name}")
-            print(f"    Age: {age_hours:.1f} hours | Size: {size_mb:.2f} MB")
-            
-            if not dry_run:
-                try:
-                    os.remove(video)
-                    deleted_count += 1
-                    total_freed += size_mb
-                except Exception as e:
-                    print(f"    ❌ Error: {e}")
+            victims.append((name, size_mb))
         else:
-            print(f"  KEEP: {video.name}")
-            print(f"    Age: {age_hours:.1f} hours | Size: {size_mb:.2f} MB")
+            status = "KEEP"
+        lines.append(_VIDEO_LINE(status=status, name=name, age=age_hours, size=size_mb))
+    
+    # One write for the whole listing instead of two prints per file
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    if dry_run:
+        deleted_count, total_freed = 0, 0
+    elif os.unlink in os.supports_dir_fd:
+        # Unlink relative to an open directory fd - no path walk per file
+        dfd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            unlink = functools.partial(os.unlink, dir_fd=dfd)
+            deleted_count, total_freed = _delete_all((unlink, name, size_mb) for name, size_mb in victims)
+        finally:
+            os.close(dfd)
+    else:
+        deleted_count, total_freed = _delete_all(
+            (lambda n: os.remove(directory / n), name, size_mb) for name, size_mb in victims
+        )
     
     print()
     if dry_run:
@@ -126,6 +119,16 @@ def cleanup_instagram_reels(older_than_hours=168, dry_run=False):
     return deleted_count
 
 
+def cleanup_youtube_shorts(older_than_hours=24, dry_run=False):
+    """Delete YouTube Shorts videos older than N hours"""
+    return _cleanup_videos(YOUTUBE_SHORTS_DIR, "YouTube Shorts", older_than_hours, dry_run)
+
+
+def cleanup_instagram_reels(older_than_hours=168, dry_run=False):
+    """Delete Instagram Reels older than N hours (default: 7 days)"""
+    return _cleanup_videos(INSTA_REELS_DIR, "Instagram Reels", older_than_hours, dry_run)
+
+
 def cleanup_temp_files(dry_run=False):
     """Delete temporary files"""
     
@@ -135,35 +138,34 @@ def cleanup_temp_files(dry_run=False):
         print("ℹ️ No temp directory found")
         return 0
     
-    files = list(temp_dir.glob("*"))
+    files = []
+    with os.scandir(temp_dir) as it:
+        for entry in it:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            size = entry.stat(follow_symlinks=False).st_size if entry.is_file(follow_symlinks=False) else 0
+            files.append((entry.name, is_dir, size))
     
     if not files:
         print("ℹ️ Temp directory is empty")
         return 0
     
-    deleted_count = 0
-    total_freed = 0
+    victims = []
+    lines = []
     
     print(f"📁 Temp directory: {temp_dir}")
     print(f"📋 Found {len(files)} file(s)")
     print()
     
-    for file in files:
-        size_mb = get_file_size(file) if file.is_file() else 0
-        status = "WILL DELETE" if dry_run else "DELETED"
-        print(f"  {status}: {file.name} ({size_mb:.2f} MB)")
-        
-        if not dry_run:
-            try:
-                if file.is_file():
-                    os.remove(file)
-                    deleted_count += 1
-                    total_freed += size_mb
-                elif file.is_dir():
-                    shutil.rmtree(file)
-                    deleted_count += 1
-            except Exception as e:
-                print(f"    ❌ Error: {e}")
+    status = "WILL DELETE" if dry_run else "DELETED"
+    for name, is_dir, size in files:
+        size_mb = size / (1024 * 1024)
+        lines.append(_TEMP_LINE(status=status, name=name, size=size_mb))
+        remove_fn = shutil.rmtree if is_dir else os.remove
+        victims.append((lambda n, fn=remove_fn: fn(temp_dir / n), name, size_mb))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    deleted_count, total_freed = (0, 0) if dry_run else _delete_all(victims)
     
     print()
     if dry_run:
@@ -174,6 +176,33 @@ def cleanup_temp_files(dry_run=False):
     return deleted_count
 
 
+def _show_video_usage(directory, label):
+    """Print usage for one video directory and return its size in MB"""
+    if not directory.exists():
+        return 0
+    
+    count = 0
+    total_bytes = 0
+    
+    def _counted(videos):
+        nonlocal count, total_bytes
+        for entry in videos:
+            count += 1
+            total_bytes += entry[1]
+            yield entry
+    
+    # Single pass: running totals plus a 5-entry heap, no full list or sort
+    top5 = heapq.nsmallest(5, _counted(_iter_videos(directory)), key=lambda e: e[0])
+    size = total_bytes / (1024 * 1024)
+    print(f"{label}: {count} files, {size:.2f} MB")
+    for name, file_size, _ in top5:
+        print(f"   • {name} ({file_size / (1024 * 1024):.2f} MB)")
+    if count > 5:
+        print(f"   ... and {count - 5} more")
+    
+    return size
+
+
 def show_disk_usage():
     """Show disk usage of video directories"""
     
@@ -184,37 +213,27 @@ def show_disk_usage():
     total_size = 0
     
     # YouTube Shorts
-    if YOUTUBE_SHORTS_DIR.exists():
-        videos = list(YOUTUBE_SHORTS_DIR.glob("*.mp4"))
-        size = sum(get_file_size(v) for v in videos)
-        total_size += size
-        print(f"📹 YouTube Shorts: {len(videos)} files, {size:.2f} MB")
-        for video in sorted(videos)[:5]:
-            print(f"   • {video.name} ({get_file_size(video):.2f} MB)")
-        if len(videos) > 5:
-            print(f"   ... and {len(videos) - 5} more")
+    total_size += _show_video_usage(YOUTUBE_SHORTS_DIR, "📹 YouTube Shorts")
     
     print()
     
     # Instagram Reels
-    if INSTA_REELS_DIR.exists():
-        videos = list(INSTA_REELS_DIR.glob("*.mp4"))
-        size = sum(get_file_size(v) for v in videos)
-        total_size += size
-        print(f"📸 Instagram Reels: {len(videos)} files, {size:.2f} MB")
-        for video in sorted(videos)[:5]:
-            print(f"   • {video.name} ({get_file_size(video):.2f} MB)")
-        if len(videos) > 5:
-            print(f"   ... and {len(videos) - 5} more")
+    total_size += _show_video_usage(INSTA_REELS_DIR, "📸 Instagram Reels")
     
     print()
     
     # Temp
     if Path("temp").exists():
-        files = list(Path("temp").glob("*"))
-        size = sum(get_file_size(f) for f in files if f.is_file())
+        file_count = 0
+        size = 0
+        with os.scandir("temp") as it:
+            for entry in it:
+                file_count += 1
+                if entry.is_file(follow_symlinks=False):
+                    size += entry.stat(follow_symlinks=False).st_size
+        size /= (1024 * 1024)
         total_size += size
-        print(f"📦 Temp: {len(files)} files, {size:.2f} MB")
+        print(f"📦 Temp: {file_count} files, {size:.2f} MB")
     
     print()
     print(f"💾 TOTAL: {total_size:.2f} MB")
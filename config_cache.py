@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Load config.yaml for main.py and generate_short.py through one shared JSON cache"""
+
+import os
+import json
+import functools
+
+CONFIG_PATH = "config.yaml"
+CONFIG_CACHE_PATH = ".config.cache.json"
+
+@functools.cache
+def load_config():
+    """Load config.yaml on first use, via a JSON cache that is rebuilt when the YAML changes"""
+    try:
+        if os.path.getmtime(CONFIG_CACHE_PATH) >= os.path.getmtime(CONFIG_PATH):
+            with open(CONFIG_CACHE_PATH, "r") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    import yaml
+    # libyaml's C parser when PyYAML was built with it, pure Python otherwise
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(CONFIG_PATH, "r") as f:
+        config = yaml.load(f, Loader=loader)
+    
+    tmp_path = f"{CONFIG_CACHE_PATH}.{os.getpid()}"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(config, f)
+        os.replace(tmp_path, CONFIG_CACHE_PATH)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"  ⚠️ Could not cache config: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    
+    return config
@@ -2,41 +2,66 @@
 """Generate a single zodiac sign video short with subscribe button"""
 
 import os
+import re
 import sys
+import shutil
+import hashlib
+import json
 import argparse
 import textwrap
+import functools
+import subprocess
+import time
 import pytz
 from datetime import datetime
-import yaml
-import requests
-from moviepy.editor import VideoFileClip, AudioFileClip, TextClip, CompositeVideoClip, ColorClip, concatenate_videoclips, ImageClip
-from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ThreadPoolExecutor
 
-# Patch for Pillow compatibility
-if not hasattr(Image, 'ANTIALIAS'):
-    Image.ANTIALIAS = Image.LANCZOS
-
-# Load config
-with open("config.yaml", "r") as f:
-    CONFIG = yaml.safe_load(f)
-
-VIDEO_CONFIG = CONFIG['video']
-SHORTS_CONFIG = CONFIG['platforms']['youtube']['shorts']
-TEXT_STYLE = CONFIG['text_style']
+from config_cache import load_config
+from h264_encoder import get_h264_encoder, output_filter
 
 # Get API keys
 GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
 HUGGINGFACE_API_KEY = os.getenv('HUGGINGFACE_API_KEY', '')
-
-# Ensure output folders exist
-os.makedirs(VIDEO_CONFIG['output_folder'], exist_ok=True)
-os.makedirs(os.path.join(VIDEO_CONFIG['output_folder'], 'youtube_shorts'), exist_ok=True)
-os.makedirs(os.path.join(VIDEO_CONFIG['output_folder'], 'instagram_reels'), exist_ok=True)
-os.makedirs(VIDEO_CONFIG['temp_folder'], exist_ok=True)
+HAS_AI = bool(GROQ_API_KEY or HUGGINGFACE_API_KEY)
 
 # Australian timezone
 AUS_TZ = pytz.timezone('Australia/Sydney')
 
+# ========================================
+# CONFIG
+# ========================================
+
+def get_overlay_dir():
+    """Rendered text overlays are cached here and reused across signs"""
+    return os.path.join(load_config()['video']['temp_folder'], 'overlays')
+
+def save_overlay(img, path):
+    """Save an overlay PNG atomically, so a crash mid-save never leaves a truncated file in the cache"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    img.save(tmp_path, format='PNG')
+    os.replace(tmp_path, path)
+
+# Cached overlays unused for this long are pruned before each render
+OVERLAY_MAX_AGE_HOURS = 24
+
+def prune_overlays(max_age_hours=OVERLAY_MAX_AGE_HOURS):
+    """Delete cached overlay PNGs (and stray tmp files) not written in max_age_hours"""
+    cutoff = time.time() - max_age_hours * 3600
+    with os.scandir(get_overlay_dir()) as it:
+        for entry in it:
+            try:
+                if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+def ensure_output_folders():
+    """Create output and temp folders"""
+    output_folder = load_config()['video']['output_folder']
+    os.makedirs(os.path.join(output_folder, 'youtube_shorts'), exist_ok=True)
+    os.makedirs(os.path.join(output_folder, 'instagram_reels'), exist_ok=True)
+    os.makedirs(get_overlay_dir(), exist_ok=True)
+
 # ========================================
 # TIMEZONE FUNCTIONS
 # ========================================
@@ -59,8 +84,11 @@ def get_day_of_week_background():
     days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     aus_date = get_australian_datetime()
     today_index = aus_date.weekday()
-    day_name = days[today_index]
-    
+    return _find_background(days[today_index])
+
+@functools.lru_cache(maxsize=1)
+def _find_background(day_name):
+    """Resolve (and log) the background for day_name once per process"""
     bg_filename = f"{day_name}_bg.mp4"
     
     print(f"  🔍 Looking for {day_name}'s background: {bg_filename}")
@@ -73,7 +101,7 @@ def get_day_of_week_background():
     print(f"  ⚠️ {day_name}_bg.mp4 not found, trying fallback...")
     
     # Fallback to default background
-    default_bg = VIDEO_CONFIG['background_video']
+    default_bg = load_config()['video']['background_video']
     if os.path.exists(default_bg):
         size_mb = os.path.getsize(default_bg) / (1024 * 1024)
         print(f"  ✅ Using default background: {default_bg} ({size_mb:.2f} MB)")
@@ -90,6 +118,8 @@ def get_day_of_week_background():
 
 def create_subscribe_button_image(width=1080, height=1920):
     """Create a modern subscribe button overlay image"""
+    from PIL import Image, ImageDraw
+    
     img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     
@@ -109,22 +139,15 @@ def create_subscribe_button_image(width=1080, height=1920):
         width=3
     )
     
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 50)
-        text_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 45)
-        channel_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 32)
-    except:
-        font = ImageFont.load_default()
-        text_font = ImageFont.load_default()
-        channel_font = ImageFont.load_default()
+    font = _load_font('DejaVuSans-Bold', 50)
+    text_font = _load_font('DejaVuSans-Bold', 45)
+    channel_font = _load_font('DejaVuSans', 32)
     
     bell_x = button_x + 30
     bell_y = button_y + 15
     draw.text((bell_x, bell_y), "🔔", font=font, fill=(255, 255, 255, 255))
     
     text = "SUBSCRIBE"
-    text_bbox = draw.textbbox((0, 0), text, font=text_font)
-    text_width = text_bbox[2] - text_bbox[0]
     text_x = bell_x + 60
     text_y = button_y + 18
     
@@ -138,106 +161,219 @@ def create_subscribe_button_image(width=1080, height=1920):
     )
     
     channel_text = "AstroFinance Daily"
-    channel_bbox = draw.textbbox((0, 0), channel_text, font=channel_font)
-    channel_width = channel_bbox[2] - channel_bbox[0]
-    channel_x = (width - channel_width) // 2
+    channel_width = channel_font.getlength(channel_text)
+    channel_x = int(width - channel_width) // 2
     channel_y = button_y + button_height + 30
     
     draw.text((channel_x, channel_y), channel_text, font=channel_font, fill=(255, 255, 255, 200))
     
     return img
 
+@functools.lru_cache(maxsize=2)
+def get_subscribe_button_overlay(width=1080, height=1920):
+    """Render the subscribe button once, cropped to its content, and return (path, y)"""
+    img = create_subscribe_button_image(width, height)
+    left, top, right, bottom = img.getbbox()
+    
+    path = os.path.join(get_overlay_dir(), f"subscribe_{width}x{height}.png")
+    save_overlay(img.crop((left, top, right, bottom)), path)
+    return path, top
+
 # ========================================
 # API FETCHING
 # ========================================
 
-def fetch_ai_content(prompt, sign, content_type='general'):
-    """Fetch content from Groq or HuggingFace"""
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """Shared session - keeps TCP/TLS connections to Groq/HuggingFace alive across calls"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset(['POST']),
+            # A long Retry-After on a 429 would stall the whole job; back off ourselves
+            respect_retry_after_header=False
+        )
+    ))
+    return session
+
+# Line limit instructions appended per content type
+PROMPT_LIMITS = {
+    'horoscope': "\n\nIMPORTANT: Summarize to exactly 26 lines total. Arrange into 3 paragraphs (9 lines each, with 1 blank line between paragraphs). Format:\n\n[Paragraph 1 - 9 lines]\n\n[Paragraph 2 - 9 lines]\n\n[Paragraph 3 - 8 lines]",
+    'wealth': "\n\nIMPORTANT: Keep your response to maximum 9 lines. Summarize concisely.",
+    'health': "\n\nIMPORTANT: Keep your response to maximum 9 lines. Summarize concisely.",
+}
+
+ASTROLOGER_SYSTEM_PROMPT = "You are a traditional Indian astrologer speaking in a warm, devotional tone. Provide only the final narration script. Keep it concise and simple for video narration."
+
+CONTENT_TYPES = ('horoscope', 'wealth', 'health')
+
+def format_prompt(prompt, sign, content_type, date_str):
+    """Fill a configured prompt and append its line limit instructions"""
+    return prompt.format(sign=sign, date=date_str) + PROMPT_LIMITS.get(content_type, "")
+
+# Reply budget for one content type; a batched request gets this much per type
+SECTION_MAX_TOKENS = 250
+
+def ask_groq(prompt, max_tokens=SECTION_MAX_TOKENS, timeout=15, **extra):
+    """Groq chat completion for prompt; the reply text or None"""
+    try:
+        response = get_http_session().post(
+            "https://api.groq.com/openai/v1/chat/completions",
+            headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            json={
+                "model": "llama-3.3-70b-versatile",
+                "messages": [
+                    {"role": "system", "content": ASTROLOGER_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.8,
+                "max_tokens": max_tokens,
+                **extra
+            },
+            timeout=timeout
+        )
+        if response.status_code == 200:
+            return response.json()['choices'][0]['message']['content'].strip()
+    except Exception as e:
+        print(f"    ⚠️ Groq API error: {e}")
+    return None
+
+def ask_huggingface(prompt, max_tokens=SECTION_MAX_TOKENS):
+    """HuggingFace text generation for prompt; the generated text or None"""
+    try:
+        response = get_http_session().post(
+            "https://router.huggingface.co/hf-inference/models/deepseek-ai/DeepSeek-V3",
+            headers={"Authorization": f"Bearer {HUGGINGFACE_API_KEY}"},
+            json={
+                "inputs": prompt,
+                "parameters": {"max_new_tokens": max_tokens, "temperature": 0.8}
+            },
+            timeout=15
+        )
+        if response.status_code == 200:
+            result = response.json()
+            if isinstance(result, list) and len(result) > 0:
+                return result[0].get('generated_text', '').strip()
+    except Exception as e:
+        print(f"    ⚠️ HuggingFace API error: {e}")
+    return None
+
+# Providers tried in order for a single prompt: (API key, ask function)
+AI_PROVIDERS = [
+    (GROQ_API_KEY, ask_groq),
+    (HUGGINGFACE_API_KEY, ask_huggingface),
+]
+
+def _section_text(value):
+    """Text for one content type of a batched JSON reply - a list of bullet
+    points is joined one per line - or None when there is nothing usable"""
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        value = "\n".join(value)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+def fetch_sign_content(sign, prompts):
+    """Fetch all content types for a sign in one Groq JSON-mode call.
+    Returns {content_type: text} for whatever came back (empty on failure)"""
+    if not GROQ_API_KEY:
+        return {}
+    
     aus_date_str = get_australian_date_string()
+    request = (
+        f"Reply with a JSON object with the keys {', '.join(CONTENT_TYPES)}, "
+        "each value a single string (put any bullet points on separate lines within it).\n\n"
+        + "\n\n".join(
+            f"{content_type}: {format_prompt(prompts[content_type], sign, content_type, aus_date_str).strip()}"
+            for content_type in CONTENT_TYPES
+        )
+    )
     
-    formatted_prompt = prompt.format(sign=sign, date=aus_date_str)
+    reply = ask_groq(
+        request,
+        max_tokens=SECTION_MAX_TOKENS * len(CONTENT_TYPES),
+        timeout=20,
+        response_format={"type": "json_object"}
+    )
+    try:
+        result = json.loads(reply) if reply else {}
+    except ValueError as e:
+        print(f"    ⚠️ Groq batched reply was not JSON: {e}")
+        return {}
+    if not isinstance(result, dict):
+        return {}
+    
+    texts = {content_type: _section_text(result.get(content_type)) for content_type in CONTENT_TYPES}
+    return {content_type: text for content_type, text in texts.items() if text}
+
+def fetch_ai_content(prompt, sign, content_type='general'):
+    """Fetch content from the first configured provider that answers"""
+    aus_date_str = get_australian_date_string()
     
-    # Add line limit instructions based on content type
-    if content_type == 'horoscope':
-        formatted_prompt += "\n\nIMPORTANT: Summarize to exactly 26 lines total. Arrange into 3 paragraphs (9 lines each, with 1 blank line between paragraphs). Format:\n\n[Paragraph 1 - 9 lines]\n\n[Paragraph 2 - 9 lines]\n\n[Paragraph 3 - 8 lines]"
-    elif content_type in ['wealth', 'health']:
-        formatted_prompt += "\n\nIMPORTANT: Keep your response to maximum 9 lines. Summarize concisely."
+    formatted_prompt = format_prompt(prompt, sign, content_type, aus_date_str)
     
     print(f"    📅 Australian date: {aus_date_str}")
     
-    if GROQ_API_KEY:
-        try:
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": [
-                        {"role": "system", "content": "You are a traditional Indian astrologer speaking in a warm, devotional tone. Provide only the final narration script. Keep it concise and simple for video narration."},
-                        {"role": "user", "content": formatted_prompt}
-                    ],
-                    "temperature": 0.8,
-                    "max_tokens": 250
-                },
-                timeout=15
-            )
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content'].strip()
-        except Exception as e:
-            print(f"    ⚠️ Groq API error: {e}")
-    
-    if HUGGINGFACE_API_KEY:
-        try:
-            response = requests.post(
-                "https://router.huggingface.co/hf-inference/models/deepseek-ai/DeepSeek-V3",
-                headers={"Authorization": f"Bearer {HUGGINGFACE_API_KEY}"},
-                json={
-                    "inputs": formatted_prompt,
-                    "parameters": {"max_new_tokens": 250, "temperature": 0.8}
-                },
-                timeout=15
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    return result[0].get('generated_text', '').strip()
-        except Exception as e:
-            print(f"    ⚠️ HuggingFace API error: {e}")
+    for api_key, ask in AI_PROVIDERS:
+        if api_key:
+            text = ask(formatted_prompt)
+            if text:
+                return text
     
     return None
 
+SIMPLE_ENGLISH_REPLACEMENTS = {
+    "planetary alignment": "stars aligning",
+    "celestial bodies": "planets",
+    "auspicious": "good",
+    "inauspicious": "challenging",
+    "propitious": "favorable",
+    "forthcoming": "coming",
+    "endeavor": "try",
+    "facilitate": "help",
+    "manifest": "happen",
+    "abundant": "lots of",
+    "prosperity": "success",
+    "adversity": "challenges",
+    "fortuitous": "lucky",
+    "serendipity": "good timing",
+}
+
+# Lowercase and Capitalized forms of every word, matched in one pass.
+# Longest first so "inauspicious" wins over "auspicious".
+_SIMPLE_LOOKUP = {}
+for _complex, _simple in SIMPLE_ENGLISH_REPLACEMENTS.items():
+    _SIMPLE_LOOKUP[_complex] = _simple
+    _SIMPLE_LOOKUP[_complex.capitalize()] = _simple.capitalize()
+_SIMPLE_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(_SIMPLE_LOOKUP, key=len, reverse=True))) + ")")
+
+# "- " / "• " / "* " bullet markers at line starts (the wealth and health prompts
+# ask for bullets) plus any markdown * / # - stripped in one pass
+_MARKUP_RE = re.compile(r"^[ \t]*[-•*][ \t]+|[*#]+", re.MULTILINE)
+
 def simplify_to_simple_english(text):
     """Convert complex text to simple, clear English"""
     if not text:
         return ""
     
-    text = text.replace("**", "").replace("*", "").replace("#", "").strip()
-    
-    replacements = {
-        "planetary alignment": "stars aligning",
-        "celestial bodies": "planets",
-        "auspicious": "good",
-        "inauspicious": "challenging",
-        "propitious": "favorable",
-        "forthcoming": "coming",
-        "endeavor": "try",
-        "facilitate": "help",
-        "manifest": "happen",
-        "abundant": "lots of",
-        "prosperity": "success",
-        "adversity": "challenges",
-        "fortuitous": "lucky",
-        "serendipity": "good timing",
-    }
-    
-    for complex_word, simple_word in replacements.items():
-        text = text.replace(complex_word, simple_word)
-        text = text.replace(complex_word.capitalize(), simple_word.capitalize())
+    text = _MARKUP_RE.sub("", text).strip()
     
-    return text
+    return _SIMPLE_RE.sub(lambda m: _SIMPLE_LOOKUP[m.group(0)], text)
+
+# "!" and "?" end sentences too - map both to "." in one pass before splitting
+_SENTENCE_END_TR = str.maketrans("!?", "..")
+
+# Built once - reused for every sentence of every section
+_LINE_WRAPPER = textwrap.TextWrapper(width=55, break_long_words=False)
 
 def clean_and_summarize(text):
     """Clean AI response - keep insight, use simple English, format for video"""
@@ -246,7 +382,8 @@ def clean_and_summarize(text):
     
     text = simplify_to_simple_english(text)
     
-    sentences = [s.strip() for s in text.replace("!", ".").replace("?", ".").split(".") if s.strip() and len(s.strip()) > 5]
+    stripped = (s.strip() for s in text.translate(_SENTENCE_END_TR).split("."))
+    sentences = [s for s in stripped if len(s) > 5]
     
     if len(sentences) > 6:
         sentences = sentences[:6]
@@ -266,47 +403,72 @@ def clean_and_summarize(text):
         else:
             cleaned_sentences.append(sent)
     
-    result = ". ".join(cleaned_sentences)
-    if result and result[-1] not in ".!?":
-        result += "."
-    
-    words = result.split()
+    # Every sentence starts on its own line, wrapped to 55 characters
     lines = []
-    current_line = []
-    
-    for word in words:
-        current_line.append(word)
-        line_text = " ".join(current_line)
-        
-        if len(line_text) > 55 or word.endswith("."):
-            lines.append(" ".join(current_line))
-            current_line = []
-    
-    if current_line:
-        lines.append(" ".join(current_line))
+    for sent in cleaned_sentences:
+        lines.extend(_LINE_WRAPPER.wrap(f"{sent}."))
     
-    result = "\n".join(lines)
-    
-    return result
+    return "\n".join(lines)
+
+# Used when no AI provider answers - already plain English, one sentence per entry
+FALLBACK_CONTENT = {
+    'horoscope': [
+        "Namaste {sign}!",
+        "The stars shine bright for you today.",
+        "Planetary energy brings opportunities in relationships and career.",
+        "Trust your intuition.",
+    ],
+    'wealth': [
+        "Do: Plan finances with Mercury's clarity.",
+        "Don't: Rush major investments today.",
+    ],
+    'health': [
+        "The Moon stirs emotions today.",
+        "Drink water mindfully and practice deep breathing for balance.",
+    ],
+}
+
+def format_fallback(content_type, sign):
+    """Lay out fallback text for video without running it through clean_and_summarize"""
+    lines = []
+    for sentence in FALLBACK_CONTENT[content_type]:
+        lines.extend(_LINE_WRAPPER.wrap(sentence.format(sign=sign)))
+    return "\n".join(lines)
 
 def get_content_for_sign(sign):
     """Get horoscope, wealth, and health content"""
     print(f"  📝 Fetching content for {sign}...")
     
-    horo = fetch_ai_content(CONFIG['free_ai']['prompts']['horoscope'], sign, content_type='horoscope')
-    if not horo:
-        horo = f"Namaste {sign}! The stars shine bright for you today. Planetary energy brings opportunities in relationships and career. Trust your intuition."
-    horo = clean_and_summarize(horo)
+    if HAS_AI:
+        prompts = load_config()['free_ai']['prompts']
+        get_http_session()  # create it here so the worker threads share one pool
+        
+        # One structured request for all three; only what it missed is fetched separately
+        texts = fetch_sign_content(sign, prompts)
+        missing = [content_type for content_type in CONTENT_TYPES if content_type not in texts]
+    else:
+        # No keys - skip the HTTP stack entirely and go straight to fallbacks
+        texts = dict.fromkeys(CONTENT_TYPES)
+        missing = []
+    
+    # The remaining requests are independent - run them concurrently so the
+    # total wait is the slowest call rather than the sum
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            futures = {
+                content_type: executor.submit(fetch_ai_content, prompts[content_type], sign, content_type)
+                for content_type in missing
+            }
+        texts.update((content_type, future.result()) for content_type, future in futures.items())
     
-    wealth = fetch_ai_content(CONFIG['free_ai']['prompts']['wealth'], sign, content_type='wealth')
-    if not wealth:
-        wealth = "Do: Plan finances with Mercury's clarity. Don't: Rush major investments today."
-    wealth = clean_and_summarize(wealth)
+    horo = texts['horoscope']
+    horo = clean_and_summarize(horo) if horo else format_fallback('horoscope', sign)
     
-    health = fetch_ai_content(CONFIG['free_ai']['prompts']['health'], sign, content_type='health')
-    if not health:
-        health = "The Moon stirs emotions today. Drink water mindfully and practice deep breathing for balance."
-    health = clean_and_summarize(health)
+    wealth = texts['wealth']
+    wealth = clean_and_summarize(wealth) if wealth else format_fallback('wealth', sign)
+    
+    health = texts['health']
+    health = clean_and_summarize(health) if health else format_fallback('health', sign)
     
     print(f"  ✅ Content ready")
     return {'horoscope': horo, 'wealth': wealth, 'health': health}
@@ -315,92 +477,287 @@ def get_content_for_sign(sign):
 # VIDEO CREATION
 # ========================================
 
+@functools.lru_cache(maxsize=1)
+def get_ffmpeg_binary():
+    """Prefer the system ffmpeg, fall back to the imageio-ffmpeg bundled binary"""
+    system_ffmpeg = shutil.which('ffmpeg')
+    if system_ffmpeg:
+        return system_ffmpeg
+    
+    import imageio_ffmpeg
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+def _quantize_font_size(size):
+    """Round font size up to an even number so near-identical sizes share a render"""
+    return (int(size) + 1) & ~1
+
+def _make_text_image(text, fontsize, color="#F5F5F5", font=None):
+    """Return a PNG overlay for text, rendered at most once per quantized size"""
+    return _render_text_image(text, _quantize_font_size(fontsize), color, font)
+
+# Font name -> TrueType files to try in order (Arial if installed, else DejaVu)
+FONT_FILES = {
+    None: ("arial.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"),
+    'Arial-Bold': ("arialbd.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
+    'DejaVuSans': ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",),
+    'DejaVuSans-Bold': ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",),
+}
+TEXT_PADDING = 4
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font, size):
+    """Load a TrueType font once per (font, size)"""
+    from PIL import ImageFont
+    
+    for candidate in FONT_FILES.get(font, FONT_FILES[None]):
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=64)
+def _render_text_image(text, fontsize, color, font):
+    """Render centered text with Pillow and save it as an RGBA PNG overlay"""
+    from PIL import Image, ImageDraw
+    
+    pil_font = _load_font(font, fontsize)
+    
+    measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    left, top, right, bottom = measure.multiline_textbbox((0, 0), text, font=pil_font, align='center')
+    
+    width = int(right - left) + 1 + 2 * TEXT_PADDING
+    height = int(bottom - top) + 1 + 2 * TEXT_PADDING
+    
+    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    ImageDraw.Draw(img).multiline_text(
+        (TEXT_PADDING - left, TEXT_PADDING - top), text, font=pil_font, fill=color, align='center'
+    )
+    
+    key = hashlib.md5(repr((text, fontsize, color, font)).encode('utf-8')).hexdigest()
+    path = os.path.join(get_overlay_dir(), f"text_{key}.png")
+    save_overlay(img, path)
+    
+    return path
+
+@functools.lru_cache(maxsize=8)
+def _make_underline_image(font_size):
+    """Draw the heading underline as a plain bar instead of rendering "━" * 20 text"""
+    from PIL import Image, ImageDraw
+    
+    width, height = font_size * 12, int(font_size * 1.2)
+    thickness = max(4, font_size // 8)
+    top = (height - thickness) // 2
+    
+    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    ImageDraw.Draw(img).rectangle((0, top, width - 1, top + thickness - 1), fill=(245, 245, 245, 255))
+    
+    path = os.path.join(get_overlay_dir(), f"underline_{font_size}.png")
+    save_overlay(img, path)
+    return path
+
+def _overlay(image, duration, start=0, y=0, fade_in=0.0, fade_out=0.0):
+    """Describe a PNG shown horizontally centered from start for duration seconds"""
+    return {
+        'image': image,
+        'start': start,
+        'duration': duration,
+        'y': y,
+        'fade_in': fade_in,
+        'fade_out': fade_out,
+    }
+
+# Overlays closer than this (in px) with identical timing are flattened into one PNG
+MERGE_GAP = 60
+
+@functools.lru_cache(maxsize=32)
+def _merge_images(layers):
+    """Paste (path, y) layers onto one horizontally centered RGBA canvas, return (path, top y)"""
+    from PIL import Image
+    
+    images = []
+    for path, y in layers:
+        with Image.open(path) as im:
+            images.append((im.convert('RGBA'), y))
+    top = min(y for _, y in images)
+    width = max(img.width for img, _ in images)
+    height = max(y + img.height for img, y in images) - top
+    
+    canvas = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    for img, y in images:
+        canvas.alpha_composite(img, ((width - img.width) // 2, y - top))
+        img.close()
+    
+    key = hashlib.md5(repr(layers).encode('utf-8')).hexdigest()
+    path = os.path.join(get_overlay_dir(), f"merged_{key}.png")
+    save_overlay(canvas, path)
+    return path, top
+
+def merge_overlays(overlays):
+    """Flatten overlays that share start/duration/fades and sit next to each other
+    vertically, so ffmpeg decodes and blends one PNG per group instead of several"""
+    from PIL import Image
+    
+    groups = {}
+    for ov in overlays:
+        key = (ov['start'], ov['duration'], ov['fade_in'], ov['fade_out'])
+        groups.setdefault(key, []).append(ov)
+    
+    merged = []
+    for (start, duration, fade_in, fade_out), group in groups.items():
+        clusters = []
+        bottom = None
+        for ov in sorted(group, key=lambda o: o['y']):
+            with Image.open(ov['image']) as im:
+                height = im.height
+            if clusters and ov['y'] <= bottom + MERGE_GAP:
+                clusters[-1].append(ov)
+                bottom = max(bottom, ov['y'] + height)
+            else:
+                clusters.append([ov])
+                bottom = ov['y'] + height
+        
+        for cluster in clusters:
+            if len(cluster) == 1:
+                merged.append(cluster[0])
+                continue
+            path, top = _merge_images(tuple((ov['image'], ov['y']) for ov in cluster))
+            merged.append(_overlay(path, duration, start=start, y=top, fade_in=fade_in, fade_out=fade_out))
+    
+    return merged
+
 def create_heading(text, font_size, duration, fade=True):
     """Create heading with underline"""
-    heading = TextClip(
-        text,
-        fontsize=font_size + 20,
-        color="#F5F5F5",
-        font='Arial-Bold',
-        method='label'
-    ).set_duration(duration)
-    
-    underline = TextClip(
-        "━" * 20,
-        fontsize=font_size // 2,
-        color="#F5F5F5",
-        method='label'
-    ).set_duration(duration)
-    
-    if fade:
-        heading = heading.fadein(0.8).fadeout(0.8)
-        underline = underline.fadein(0.8).fadeout(0.8)
+    fade_time = 0.8 if fade else 0.0
+    heading = _overlay(_make_text_image(text, font_size + 20, font='Arial-Bold'), duration,
+                       fade_in=fade_time, fade_out=fade_time)
+    underline = _overlay(_make_underline_image(font_size // 2), duration,
+                         fade_in=fade_time, fade_out=fade_time)
     
     return heading, underline
 
+# Built once - textwrap.wrap() constructs a new TextWrapper on every call
+_CHUNK_WRAPPER = textwrap.TextWrapper(width=35)
+
 def create_text_chunks(text, font_size, total_duration):
     """Split text into smart chunks"""
     wrapped_lines = []
     for line in text.split('\n'):
         if line.strip():
-            wrapped_lines.extend(textwrap.wrap(line, width=35))
+            wrapped_lines.extend(_CHUNK_WRAPPER.wrap(line))
     
     total_lines = len(wrapped_lines)
     
     if total_lines <= 8:
-        chunks = ["\n".join(wrapped_lines)]
+        chunk_groups = [wrapped_lines]
     elif total_lines <= 16:
-        mid = len(wrapped_lines) // 2
-        chunks = ["\n".join(wrapped_lines[:mid]), "\n".join(wrapped_lines[mid:])]
+        mid = total_lines // 2
+        chunk_groups = [wrapped_lines[:mid], wrapped_lines[mid:]]
     else:
         LINES_PER_CHUNK = 9
-        chunks = []
-        for i in range(0, len(wrapped_lines), LINES_PER_CHUNK):
-            chunk_lines = wrapped_lines[i:i + LINES_PER_CHUNK]
-            chunks.append("\n".join(chunk_lines))
+        chunk_groups = [wrapped_lines[i:i + LINES_PER_CHUNK] for i in range(0, total_lines, LINES_PER_CHUNK)]
+    
+    chunks = ["\n".join(lines) for lines in chunk_groups]
+    chunk_line_counts = [len(lines) for lines in chunk_groups]
     
     text_clips = []
     
     if len(chunks) == 1:
-        clip = TextClip(
-            chunks[0],
-            fontsize=font_size,
-            color="#F5F5F5",
-            method='label',
-            align='center'
-        ).set_duration(total_duration).set_start(0).fadein(0.8).fadeout(0.8)
+        clip = _overlay(_make_text_image(chunks[0], font_size), total_duration, fade_in=0.8, fade_out=0.8)
         text_clips.append(clip)
     else:
-        chunk_line_counts = [len(chunk.split('\n')) for chunk in chunks]
-        total_lines_all = sum(chunk_line_counts)
+        total_lines_all = total_lines
         
         current_time = 0
         for i, chunk in enumerate(chunks):
             lines_in_chunk = chunk_line_counts[i]
             chunk_duration = max(3.0, (lines_in_chunk / total_lines_all) * total_duration)
             
-            clip = TextClip(
-                chunk,
-                fontsize=font_size,
-                color="#F5F5F5",
-                method='label',
-                align='center'
-            ).set_duration(chunk_duration).set_start(current_time).fadein(0.8).fadeout(0.8)
+            clip = _overlay(_make_text_image(chunk, font_size), chunk_duration, start=current_time,
+                            fade_in=0.8, fade_out=0.8)
             
             text_clips.append(clip)
             current_time += chunk_duration
     
     return text_clips
 
+def build_ffmpeg_command(bg_video_path, overlays, screen_size, duration, output_file, music_path=None):
+    """Build one ffmpeg call that scales/crops/loops the background, overlays
+    every PNG in its time window, mixes the looped music and encodes"""
+    video_config = load_config()['video']
+    target_w, target_h = screen_size
+    fps = load_config()['platforms']['youtube']['shorts']['fps']
+    
+    cmd = [get_ffmpeg_binary(), '-y', '-hide_banner', '-loglevel', 'error',
+           '-stream_loop', '-1', '-i', bg_video_path]
+    for overlay in overlays:
+        cmd += ['-loop', '1', '-framerate', str(fps), '-t', f"{duration}", '-i', overlay['image']]
+    if music_path:
+        cmd += ['-stream_loop', '-1', '-i', music_path]
+    
+    # Scale to cover the frame, then center-crop (same framing as the old resize+crop)
+    filters = [
+        f"[0:v]scale={target_w}:{target_h}:force_original_aspect_ratio=increase,"
+        f"crop={target_w}:{target_h},setsar=1,fps={fps}[v0]"
+    ]
+    
+    last = "v0"
+    for i, overlay in enumerate(overlays, 1):
+        start = overlay['start']
+        end = start + overlay['duration']
+        
+        chain = f"[{i}:v]format=rgba"
+        if overlay['fade_in']:
+            chain += f",fade=t=in:st={start:.3f}:d={overlay['fade_in']}:alpha=1"
+        if overlay['fade_out']:
+            chain += f",fade=t=out:st={end - overlay['fade_out']:.3f}:d={overlay['fade_out']}:alpha=1"
+        filters.append(f"{chain}[o{i}]")
+        filters.append(
+            f"[{last}][o{i}]overlay=x=(W-w)/2:y={overlay['y']}:"
+            f"enable='between(t,{start:.3f},{end:.3f})'[v{i}]"
+        )
+        last = f"v{i}"
+    
+    codec, codec_params = get_h264_encoder(get_ffmpeg_binary())
+    if codec == 'libx264':
+        codec_params = ['-preset', 'medium']
+    filters.append(f"[{last}]{output_filter(codec)}[vout]")
+    
+    if music_path:
+        filters.append(f"[{len(overlays) + 1}:a]volume={video_config['music_volume']}[aout]")
+    
+    cmd += ['-filter_complex', ';'.join(filters), '-map', '[vout]']
+    cmd += ['-map', '[aout]'] if music_path else ['-map', '0:a?']
+    
+    cmd += [
+        '-t', f"{duration}",
+        '-r', str(fps),
+        '-c:v', codec,
+        *codec_params,
+        '-b:v', '2000k',
+        '-c:a', 'aac',
+        '-b:a', '128k',
+        '-movflags', '+faststart',
+        output_file,
+    ]
+    
+    return cmd
+
 def create_short(sign, content):
     """Create video short"""
     print(f"  🎬 Creating video for {sign}...")
     
+    config = load_config()
+    video_config = config['video']
+    text_style = config['text_style']
+    ensure_output_folders()
+    prune_overlays()
+    
     # Get Australian date for video
     aus_datetime = get_australian_datetime()
     aus_date_display = aus_datetime.strftime("%d %b %Y")
     
-    screen_size = SHORTS_CONFIG['resolution']
+    screen_size = config['platforms']['youtube']['shorts']['resolution']
     
     # FIXED TIMING
     HOROSCOPE_TIME = 30
@@ -417,31 +774,6 @@ def create_short(sign, content):
         print(f"  ❌ No background video available")
         return None
     
-    bg_original = VideoFileClip(bg_video_path)
-    target_w, target_h = screen_size
-    bg_w, bg_h = bg_original.size
-    
-    scale = target_h / bg_h
-    new_w = int(bg_w * scale)
-    
-    if new_w >= target_w:
-        bg_original = bg_original.resize(height=target_h)
-        x_center = bg_original.w / 2
-        x1 = int(x_center - target_w / 2)
-        bg_original = bg_original.crop(x1=x1, width=target_w)
-    else:
-        bg_original = bg_original.resize(width=target_w)
-        if bg_original.h > target_h:
-            y_center = bg_original.h / 2
-            y1 = int(y_center - target_h / 2)
-            bg_original = bg_original.crop(y1=y1, height=target_h)
-    
-    if bg_original.duration < TARGET_DURATION:
-        loops = int(TARGET_DURATION / bg_original.duration) + 1
-        bg_clip = bg_original.loop(n=loops).subclip(0, TARGET_DURATION)
-    else:
-        bg_clip = bg_original.subclip(0, TARGET_DURATION)
-    
     all_clips = []
     current_time = 0
     
@@ -454,132 +786,68 @@ def create_short(sign, content):
     # Title
     title_heading, title_underline = create_heading(
         f"✨ {sign} ✨",
-        TEXT_STYLE['title_font_size'] + 1,
+        text_style['title_font_size'] + 1,
         MAIN_DURATION,
         fade=False
     )
-    title_heading = title_heading.set_position(('center', SIGN_Y))
-    title_underline = title_underline.set_position(('center', SIGN_Y + 100))
+    title_heading['y'] = SIGN_Y
+    title_underline['y'] = SIGN_Y + 100
     all_clips.extend([title_heading, title_underline])
     
-    date_clip = TextClip(
-        aus_date_display,
-        fontsize=36,
-        color="#F5F5F5",
-        method='label'
-    ).set_duration(MAIN_DURATION).set_position(('center', DATE_Y))
+    date_clip = _overlay(_make_text_image(aus_date_display, 36), MAIN_DURATION, y=DATE_Y)
     all_clips.append(date_clip)
     
-    # Horoscope (30 seconds)
-    horo_heading, horo_underline = create_heading(
-        "🌙 Daily Horoscope",
-        TEXT_STYLE['content_font_size'] + 1,
-        HOROSCOPE_TIME
-    )
-    horo_heading = horo_heading.set_position(('center', HORO_HEADING_Y)).set_start(current_time)
-    horo_underline = horo_underline.set_position(('center', HORO_HEADING_Y + 100)).set_start(current_time)
-    all_clips.extend([horo_heading, horo_underline])
-    
-    horo_chunks = create_text_chunks(content['horoscope'], TEXT_STYLE['content_font_size'] - 4, HOROSCOPE_TIME)
-    for chunk in horo_chunks:
-        all_clips.append(chunk.set_position(('center', TEXT_Y)).set_start(current_time + chunk.start))
-    current_time += HOROSCOPE_TIME
-    
-    # Wealth (12 seconds)
-    wealth_heading, wealth_underline = create_heading(
-        "💰 Wealth Tips",
-        TEXT_STYLE['content_font_size'] + 1,
-        WEALTH_TIME
-    )
-    wealth_heading = wealth_heading.set_position(('center', HORO_HEADING_Y)).set_start(current_time)
-    wealth_underline = wealth_underline.set_position(('center', HORO_HEADING_Y + 100)).set_start(current_time)
-    all_clips.extend([wealth_heading, wealth_underline])
-    
-    wealth_chunks = create_text_chunks(content['wealth'], TEXT_STYLE['tip_font_size'] - 4, WEALTH_TIME)
-    for chunk in wealth_chunks:
-        all_clips.append(chunk.set_position(('center', TEXT_Y)).set_start(current_time + chunk.start))
-    current_time += WEALTH_TIME
-    
-    # Health (12 seconds)
-    health_heading, health_underline = create_heading(
-        "🏥 Health Tips",
-        TEXT_STYLE['content_font_size'] + 1,
-        HEALTH_TIME
-    )
-    health_heading = health_heading.set_position(('center', HORO_HEADING_Y)).set_start(current_time)
-    health_underline = health_underline.set_position(('center', HORO_HEADING_Y + 100)).set_start(current_time)
-    all_clips.extend([health_heading, health_underline])
-    
-    health_chunks = create_text_chunks(content['health'], TEXT_STYLE['tip_font_size'] - 4, HEALTH_TIME)
-    for chunk in health_chunks:
-        all_clips.append(chunk.set_position(('center', TEXT_Y)).set_start(current_time + chunk.start))
-    current_time += HEALTH_TIME
+    # Horoscope (30 seconds), Wealth (12 seconds), Health (12 seconds)
+    sections = [
+        ("🌙 Daily Horoscope", content['horoscope'], text_style['content_font_size'] - 4, HOROSCOPE_TIME),
+        ("💰 Wealth Tips", content['wealth'], text_style['tip_font_size'] - 4, WEALTH_TIME),
+        ("🏥 Health Tips", content['health'], text_style['tip_font_size'] - 4, HEALTH_TIME),
+    ]
+    
+    for title, text, font_size, section_time in sections:
+        heading, underline = create_heading(title, text_style['content_font_size'] + 1, section_time)
+        heading.update(y=HORO_HEADING_Y, start=current_time)
+        underline.update(y=HORO_HEADING_Y + 100, start=current_time)
+        all_clips.extend([heading, underline])
+        
+        for chunk in create_text_chunks(text, font_size, section_time):
+            chunk.update(y=TEXT_Y, start=current_time + chunk['start'])
+            all_clips.append(chunk)
+        current_time += section_time
     
     # Subscribe button overlay (on last 5 seconds, doesn't extend video)
-    sub_button_img = create_subscribe_button_image(screen_size[0], screen_size[1])
-    sub_button_img.save(os.path.join(VIDEO_CONFIG['temp_folder'], 'subscribe_button.png'))
-    sub_button_clip = ImageClip(os.path.join(VIDEO_CONFIG['temp_folder'], 'subscribe_button.png')).set_duration(5).set_start(current_time - 5)
-    sub_button_clip = sub_button_clip.fadein(0.3)
-    all_clips.append(sub_button_clip)
-    
-    # Composite
-    final_video = CompositeVideoClip([bg_clip] + all_clips).set_duration(TARGET_DURATION)
-    
-    # Add music
-    if os.path.exists(VIDEO_CONFIG['background_music']):
-        music = AudioFileClip(VIDEO_CONFIG['background_music']).volumex(VIDEO_CONFIG['music_volume'])
-        if music.duration < TARGET_DURATION:
-            loops = int(TARGET_DURATION / music.duration) + 1
-            music = music.loop(n=loops).subclip(0, TARGET_DURATION)
-        else:
-            music = music.subclip(0, TARGET_DURATION)
-        final_video = final_video.set_audio(music)
+    sub_button_path, sub_button_y = get_subscribe_button_overlay(screen_size[0], screen_size[1])
+    all_clips.append(_overlay(sub_button_path, SUBSCRIBE_DURATION, start=current_time - SUBSCRIBE_DURATION,
+                              y=sub_button_y, fade_in=0.3))
     
-    output_file = os.path.join(
-        VIDEO_CONFIG['output_folder'],
-        'youtube_shorts',
-        f"{sign}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-    )
+    music_path = video_config['background_music'] if os.path.exists(video_config['background_music']) else None
     
-    final_video.write_videofile(
-        output_file,
-        fps=SHORTS_CONFIG['fps'],
-        codec='libx264',
-        audio_codec='aac',
-        preset='medium',
-        bitrate='2000k',
-        audio_bitrate='128k',
-        logger=None,
-        verbose=False
-    )
+    # Shorts and Reels copies share one timestamp
+    file_name = f"{sign}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
+    output_file = os.path.join(video_config['output_folder'], 'youtube_shorts', file_name)
+    
+    # Composite + encode in a single ffmpeg pass
+    all_clips = merge_overlays(all_clips)
+    cmd = build_ffmpeg_command(bg_video_path, all_clips, screen_size, TARGET_DURATION, output_file, music_path)
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr.strip()[-1000:]}")
     
     print(f"  ✅ Video created: {output_file}")
     
     # Also save to Instagram Reels folder
-    insta_output = os.path.join(
-        VIDEO_CONFIG['output_folder'],
-        'instagram_reels',
-        f"{sign}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-    )
+    insta_output = os.path.join(video_config['output_folder'], 'instagram_reels', file_name)
     
     try:
-        import shutil
-        shutil.copy(output_file, insta_output)
+        # Hardlink - same bytes, no copy; fall back to a real copy across filesystems
+        try:
+            os.link(output_file, insta_output)
+        except OSError:
+            shutil.copy(output_file, insta_output)
         print(f"  ✅ Copied to Instagram Reels: {insta_output}")
     except Exception as e:
         print(f"  ⚠️ Could not copy to Instagram Reels: {e}")
     
-    # Cleanup
-    bg_original.close()
-    bg_clip.close()
-    final_video.close()
-    
-    # Remove temp button image
-    try:
-        os.remove(os.path.join(VIDEO_CONFIG['temp_folder'], 'subscribe_button.png'))
-    except:
-        pass
-    
     return output_file
 
 # ========================================
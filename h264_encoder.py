@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Pick the H.264 encoder shared by main.py and generate_short.py"""
+
+import functools
+import subprocess
+
+# Hardware H.264 encoders in order of preference, with their encoder flags
+HW_H264_ENCODERS = [
+    ('h264_nvenc', ['-preset', 'p4', '-tune', 'hq', '-rc', 'vbr']),
+    ('h264_qsv', ['-preset', 'veryfast']),
+    ('h264_vaapi', ['-vaapi_device', '/dev/dri/renderD128']),
+    ('h264_videotoolbox', []),
+]
+
+# Final filter per encoder: VAAPI needs frames uploaded to the GPU, the rest take yuv420p
+HW_OUTPUT_FILTERS = {
+    'h264_vaapi': 'format=nv12,hwupload',
+}
+
+def output_filter(codec):
+    """Last video filter to run before handing frames to codec"""
+    return HW_OUTPUT_FILTERS.get(codec, 'format=yuv420p')
+
+@functools.lru_cache(maxsize=None)
+def get_h264_encoder(ffmpeg):
+    """Return (codec, params) for the first hardware encoder that works with
+    this ffmpeg binary, else ('libx264', []) so the caller keeps its own preset"""
+    try:
+        available = subprocess.run(
+            [ffmpeg, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=30
+        ).stdout
+
+        for codec, params in HW_H264_ENCODERS:
+            if codec not in available:
+                continue
+            # Being listed only means ffmpeg was built with it - check a device exists
+            probe = subprocess.run(
+                [ffmpeg, '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=black:s=256x256:d=0.1',
+                 '-vf', output_filter(codec),
+                 '-c:v', codec, *params, '-f', 'null', '-'],
+                capture_output=True, timeout=30
+            )
+            if probe.returncode == 0:
+                print(f"  ⚡ Hardware encoder: {codec}")
+                return codec, params
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"  ⚠️ Encoder probe failed: {e}")
+
+    return 'libx264', []
@@ -1,40 +1,101 @@
 import os
-from datetime import datetime
+import re
+import json
+import hashlib
+from datetime import date, datetime, timedelta
 import textwrap
-import yaml
+import functools
+import itertools
+import subprocess
+import imageio_ffmpeg
 import requests
-from moviepy.editor import VideoFileClip, AudioFileClip, TextClip, CompositeVideoClip
-from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from moviepy.editor import VideoFileClip, AudioFileClip, ImageClip, CompositeVideoClip
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+import numpy as np
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 import time
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from config_cache import load_config
+from h264_encoder import get_h264_encoder, output_filter
 
 # Patch for Pillow compatibility
 if not hasattr(Image, 'ANTIALIAS'):
     Image.ANTIALIAS = Image.LANCZOS
 
 # Load config
-with open("config.yaml", "r") as f:
-    CONFIG = yaml.safe_load(f)
+CONFIG = load_config()
 
 VIDEO_CONFIG = CONFIG['video']
 SHORTS_CONFIG = CONFIG['platforms']['youtube']['shorts']
 TEXT_STYLE = CONFIG['text_style']
 ZODIAC_SIGNS = CONFIG['zodiac_signs']
 
+# Weekday backgrounds are picked in Australian time, like generate_short.py does
+AUS_TZ = ZoneInfo('Australia/Sydney')
+
+# Weekday names used in the {Day}_bg.mp4 background filenames, indexed by weekday()
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# One date for the whole run, so titles, filenames and the on-screen date agree
+RUN_DATE = datetime.now()
+
+# Length of every short in seconds
+SHORT_DURATION = 59
+
+# Renders run in separate processes; ffmpeg threads are split between them
+RENDER_WORKERS = min(4, os.cpu_count() or 1)
+RENDER_THREADS = max(1, (os.cpu_count() or 1) // RENDER_WORKERS)
+
 # Get API keys from environment
 GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
 HUGGINGFACE_API_KEY = os.getenv('HUGGINGFACE_API_KEY', '')
+HAS_AI = bool(GROQ_API_KEY or HUGGINGFACE_API_KEY)
 YOUTUBE_CLIENT_ID = os.getenv('YOUTUBE_CLIENT_ID', '')
 YOUTUBE_CLIENT_SECRET = os.getenv('YOUTUBE_CLIENT_SECRET', '')
 YOUTUBE_REFRESH_TOKEN = os.getenv('YOUTUBE_REFRESH_TOKEN', '')
 
+# Most AI requests in flight at once when fetching content for all signs
+AI_FETCH_WORKERS = 8
+
+# Shared HTTP session - keeps TCP/TLS connections to Groq/HuggingFace alive
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=AI_FETCH_WORKERS,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(['POST']),
+        # A long Retry-After on a 429 would stall the whole run; back off ourselves
+        respect_retry_after_header=False
+    )
+))
+
+# Text cleanup patterns
+# Bullet markers at line starts plus any markdown * / # - stripped in one pass
+_STRIP_RE = re.compile(r"^[ \t]*[-•*][ \t]+|[*#]+", re.MULTILINE)
+_PREFIX_RE = re.compile(r"^(?:Here is|Here's|Today's|For today|Namaste)\s*[:,]?\s*")
+_SENT_RE = re.compile(r"[.!?]+")
+
 # Ensure output folders exist
 os.makedirs(VIDEO_CONFIG['output_folder'], exist_ok=True)
 os.makedirs(os.path.join(VIDEO_CONFIG['output_folder'], 'youtube_shorts'), exist_ok=True)
 os.makedirs(VIDEO_CONFIG['temp_folder'], exist_ok=True)
 
+# Last good AI responses: today's skip the API calls on re-runs, older ones
+# (up to AI_CACHE_STALE_DAYS) stand in when the AI is down. Kept outside the
+# temp folder, which is wiped after every run; CI restores it with actions/cache
+AI_CACHE_DIR = ".ai_cache"
+AI_CACHE_PATH = os.path.join(AI_CACHE_DIR, 'ai_cache.json')
+AI_CACHE_STALE_DAYS = 7
+os.makedirs(AI_CACHE_DIR, exist_ok=True)
+
 
 # ========================================
 # YOUTUBE UPLOAD FUNCTIONS
@@ -62,7 +123,7 @@ def upload_to_youtube(video_path, sign):
         youtube = build('youtube', 'v3', credentials=credentials)
         
         # Create video metadata
-        today = datetime.now().strftime("%B %d, %Y")
+        today = RUN_DATE.strftime("%B %d, %Y")
         title = f"{sign} Daily Horoscope & Cosmic Guidance | {today} #Shorts"
         description = f"""🌟 {sign} Daily Horoscope for {today}
 
@@ -131,67 +192,131 @@ def upload_to_youtube(video_path, sign):
 # API FETCHING FUNCTIONS
 # ========================================
 
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = "llama-3.3-70b-versatile"
+HF_URL = "https://router.huggingface.co/hf-inference/models/deepseek-ai/DeepSeek-V3"
+ASTROLOGER_SYSTEM_PROMPT = "You are a warm Vedic astrologer. Keep responses concise and natural."
+
+
+# Reply budget for one section; a batched request gets this much per section
+SECTION_MAX_TOKENS = 150
+
+
+def ask_groq(prompt, max_tokens=SECTION_MAX_TOKENS, timeout=15, **extra):
+    """Groq chat completion for prompt; the reply text or None"""
+    try:
+        response = _SESSION.post(
+            GROQ_URL,
+            headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            json={
+                "model": GROQ_MODEL,
+                "messages": [
+                    {"role": "system", "content": ASTROLOGER_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.7,
+                "max_tokens": max_tokens,
+                **extra
+            },
+            timeout=timeout
+        )
+        if response.status_code == 200:
+            return response.json()['choices'][0]['message']['content'].strip()
+    except:
+        pass
+    return None
+
+
+def ask_huggingface(prompt, max_tokens=SECTION_MAX_TOKENS):
+    """HuggingFace text generation for prompt; the generated text or None"""
+    try:
+        response = _SESSION.post(
+            HF_URL,
+            headers={"Authorization": f"Bearer {HUGGINGFACE_API_KEY}"},
+            json={
+                "inputs": prompt,
+                "parameters": {"max_new_tokens": max_tokens, "temperature": 0.7}
+            },
+            timeout=15
+        )
+        if response.status_code == 200:
+            result = response.json()
+            if isinstance(result, list) and len(result) > 0:
+                return result[0].get('generated_text', '').strip()
+    except:
+        pass
+    return None
+
+
+# Providers tried in order for a single prompt: (API key, ask function)
+AI_PROVIDERS = [
+    (GROQ_API_KEY, ask_groq),
+    (HUGGINGFACE_API_KEY, ask_huggingface),
+]
+
+
 def fetch_ai_content(prompt, sign):
-    """Fetch content from Groq or HuggingFace"""
+    """Fetch content from the first configured provider that answers"""
     formatted_prompt = prompt.format(sign=sign)
     
-    if GROQ_API_KEY:
-        try:
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": [
-                        {"role": "system", "content": "You are a warm Vedic astrologer. Keep responses concise and natural."},
-                        {"role": "user", "content": formatted_prompt}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 150
-                },
-                timeout=15
-            )
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content'].strip()
-        except:
-            pass
-    
-    if HUGGINGFACE_API_KEY:
-        try:
-            response = requests.post(
-                "https://router.huggingface.co/hf-inference/models/deepseek-ai/DeepSeek-V3",
-                headers={"Authorization": f"Bearer {HUGGINGFACE_API_KEY}"},
-                json={
-                    "inputs": formatted_prompt,
-                    "parameters": {"max_new_tokens": 150, "temperature": 0.7}
-                },
-                timeout=15
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    return result[0].get('generated_text', '').strip()
-        except:
-            pass
+    for api_key, ask in AI_PROVIDERS:
+        if api_key:
+            text = ask(formatted_prompt)
+            if text:
+                return text
     
     return None
 
 
+CONTENT_SECTIONS = ('horoscope', 'wealth', 'health')
+
+
+def _section_text(value):
+    """Text for one section of a batched JSON reply - a list of bullet points
+    is joined one per line - or None when there is nothing usable"""
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        value = "\n".join(value)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def fetch_sign_content(sign):
+    """Fetch all three sections for a sign in one Groq JSON-mode call.
+    Returns {section: text} for the sections that came back (empty on failure)"""
+    if not GROQ_API_KEY:
+        return {}
+    
+    prompts = CONFIG['free_ai']['prompts']
+    request = (
+        f"Reply with a JSON object with the keys {', '.join(CONTENT_SECTIONS)}, "
+        "each value a single string (put any bullet points on separate lines within it).\n\n"
+        + "\n\n".join(f"{section}: {prompts[section].format(sign=sign).strip()}" for section in CONTENT_SECTIONS)
+    )
+    
+    reply = ask_groq(
+        request,
+        max_tokens=SECTION_MAX_TOKENS * len(CONTENT_SECTIONS),
+        timeout=20,
+        response_format={"type": "json_object"}
+    )
+    try:
+        result = json.loads(reply) if reply else {}
+    except ValueError:
+        return {}
+    if not isinstance(result, dict):
+        return {}
+    
+    texts = {section: _section_text(result.get(section)) for section in CONTENT_SECTIONS}
+    return {section: text for section, text in texts.items() if text}
+
+
 def clean_and_summarize(text):
     """Clean AI response and make it concise"""
-    text = text.replace("**", "").replace("*", "").replace("#", "").strip()
-    
-    prefixes = ["Here is", "Here's", "Today's", "For today", "Namaste"]
-    for prefix in prefixes:
-        if text.startswith(prefix):
-            text = text[len(prefix):].strip()
-            if text.startswith(":") or text.startswith(","):
-                text = text[1:].strip()
+    text = _STRIP_RE.sub("", text).strip()
+    text = _PREFIX_RE.sub("", text, count=1)
     
-    sentences = [s.strip() for s in text.replace("!", ".").replace("?", ".").split(".") if s.strip()]
+    sentences = [s.strip() for s in _SENT_RE.split(text) if s.strip()]
     if len(sentences) > 4:
         sentences = sentences[:4]
     
@@ -202,55 +327,288 @@ def clean_and_summarize(text):
     return result
 
 
-def get_content_for_sign(sign):
-    """Get horoscope, wealth, and health content"""
-    print(f"  📝 Fetching content...")
-    
-    horo = fetch_ai_content(CONFIG['free_ai']['prompts']['horoscope'], sign)
-    if not horo:
-        horo = f"Namaste {sign}! The stars shine bright for you today. Planetary energy brings opportunities in relationships and career. Trust your intuition."
-    horo = clean_and_summarize(horo)
-    
-    wealth = fetch_ai_content(CONFIG['free_ai']['prompts']['wealth'], sign)
-    if not wealth:
-        wealth = "Do: Plan finances with Mercury's clarity. Don't: Rush major investments today."
-    wealth = clean_and_summarize(wealth)
-    
-    health = fetch_ai_content(CONFIG['free_ai']['prompts']['health'], sign)
-    if not health:
-        health = "The Moon stirs emotions today. Drink water mindfully and practice deep breathing for balance."
-    health = clean_and_summarize(health)
-    
-    print(f"  ✅ Content ready")
-    return {'horoscope': horo, 'wealth': wealth, 'health': health}
+# Fallback text per section when the AI gives nothing back
+FALLBACK_CONTENT = {
+    'horoscope': "Namaste {sign}! The stars shine bright for you today. Planetary energy brings opportunities in relationships and career. Trust your intuition.",
+    'wealth': "Do: Plan finances with Mercury's clarity. Don't: Rush major investments today.",
+    'health': "The Moon stirs emotions today. Drink water mindfully and practice deep breathing for balance.",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def fallback_content(section, sign):
+    """Cleaned fallback text for a section (wealth/health are the same for every sign)"""
+    return clean_and_summarize(FALLBACK_CONTENT[section].format(sign=sign))
+
+
+def build_content(sign, horo, wealth, health):
+    """Fill in fallbacks for missing AI responses and clean the rest"""
+    return {
+        section: clean_and_summarize(text) if text else fallback_content(section, sign)
+        for section, text in zip(CONTENT_SECTIONS, (horo, wealth, health))
+    }
+
+
+def _ai_cache_key(prompt, sign):
+    """Cache key for one prompt/sign pair (the entry records its own date)"""
+    payload = json.dumps({'prompt': prompt, 'sign': sign}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_ai_cache():
+    """Cached AI responses as {key: (date, text)}; entries older than
+    AI_CACHE_STALE_DAYS are dropped"""
+    oldest = RUN_DATE.date() - timedelta(days=AI_CACHE_STALE_DAYS)
+    try:
+        with open(AI_CACHE_PATH, "r") as f:
+            cache = json.load(f)
+        entries = {key: (date.fromisoformat(day), text) for key, (day, text) in cache.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+    return {key: (day, text) for key, (day, text) in entries.items() if day >= oldest}
+
+
+def save_ai_cache(cache):
+    """Write {key: (date, text)} atomically, dates as ISO strings"""
+    tmp_path = f"{AI_CACHE_PATH}.{os.getpid()}"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({key: [day.isoformat(), text] for key, (day, text) in cache.items()}, f)
+        os.replace(tmp_path, AI_CACHE_PATH)
+    except OSError as e:
+        print(f"⚠️ Could not cache AI content: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def get_content_for_signs(signs):
+    """Fetch content for every sign through one shared pool: one batched request
+    per sign, then per-section requests only for whatever that left missing.
+    Responses already cached for today are reused without any request, and when
+    the AI fails the last good response (up to AI_CACHE_STALE_DAYS old) beats the
+    static fallback"""
+    if not HAS_AI:
+        return {sign: build_content(sign, None, None, None) for sign in signs}
+    
+    print(f"📝 Fetching content for {len(signs)} signs...")
+    
+    prompts = CONFIG['free_ai']['prompts']
+    today = RUN_DATE.date()
+    cache = load_ai_cache()
+    keys = {
+        (sign, section): _ai_cache_key(prompts[section], sign)
+        for sign in signs
+        for section in CONTENT_SECTIONS
+    }
+    texts = {pair: cache[key][1] for pair, key in keys.items() if key in cache and cache[key][0] == today}
+    to_fetch = [sign for sign in signs if any((sign, section) not in texts for section in CONTENT_SECTIONS)]
+    if len(to_fetch) < len(signs):
+        print(f"♻️ Using cached content for {len(signs) - len(to_fetch)} sign(s)")
+    
+    with ThreadPoolExecutor(max_workers=AI_FETCH_WORKERS) as executor:
+        batched = {sign: executor.submit(fetch_sign_content, sign) for sign in to_fetch}
+        
+        futures = {}
+        for sign in to_fetch:
+            got = batched[sign].result()
+            for section in CONTENT_SECTIONS:
+                if (sign, section) in texts:
+                    continue
+                if section in got:
+                    texts[(sign, section)] = got[section]
+                else:
+                    futures[(sign, section)] = executor.submit(fetch_ai_content, prompts[section], sign)
+    
+    texts.update((pair, future.result()) for pair, future in futures.items())
+    
+    # Only real AI responses are cached - fallbacks are retried next run
+    fetched = {
+        keys[pair]: (today, text)
+        for pair, text in texts.items()
+        if text and cache.get(keys[pair], (None,))[0] != today
+    }
+    if fetched:
+        save_ai_cache({**cache, **fetched})
+    
+    stale = [pair for pair, text in texts.items() if not text and keys[pair] in cache]
+    if stale:
+        print(f"♻️ AI unavailable for {len(stale)} section(s) - reusing last good responses")
+        texts.update((pair, cache[keys[pair]][1]) for pair in stale)
+    
+    contents = {
+        sign: build_content(sign, *(texts[(sign, section)] for section in CONTENT_SECTIONS))
+        for sign in signs
+    }
+    print(f"✅ Content ready")
+    return contents
 
 
 # ========================================
 # VIDEO CREATION FUNCTIONS
 # ========================================
 
-def create_heading(text, font_size, color, duration, screen_size, fade=True):
-    """Create heading with underline"""
-    heading = TextClip(
-        text,
-        fontsize=font_size + 20,
-        color="#F5F5F5",
-        font='Arial-Bold',
-        method='label'
-    ).set_duration(duration)
-    
-    underline = TextClip(
-        "━" * 20,
-        fontsize=font_size // 2,
-        color="#F5F5F5",
-        method='label'
-    ).set_duration(duration)
+# Font name -> TrueType files to try in order (Arial if installed, else DejaVu)
+FONT_FILES = {
+    None: ("arial.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"),
+    'Arial-Bold': ("arialbd.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
+}
+TEXT_PADDING = 4
+
+
+@functools.lru_cache(maxsize=32)
+def load_font(font, size):
+    """Load a TrueType font once per (font, size)"""
+    for candidate in FONT_FILES.get(font, FONT_FILES[None]):
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _text_box(text, pil_font):
+    """Padded (width, height) and draw origin of centered multiline text"""
+    measure = ImageDraw.Draw(Image.new('L', (1, 1)))
+    left, top, right, bottom = measure.multiline_textbbox((0, 0), text, font=pil_font, align='center')
+    size = (int(right - left) + 1 + 2 * TEXT_PADDING, int(bottom - top) + 1 + 2 * TEXT_PADDING)
+    return size, (TEXT_PADDING - left, TEXT_PADDING - top)
+
+
+@functools.lru_cache(maxsize=128)
+def render_text_mask(text, font_size, font=None):
+    """Render centered text as a single-channel coverage mask (float 0..1, read-only).
+    Cached: headings, underlines and the subscribe line repeat for every sign"""
+    pil_font = load_font(font, font_size)
+    size, origin = _text_box(text, pil_font)
+    
+    img = Image.new('L', size, 0)
+    ImageDraw.Draw(img).multiline_text(origin, text, font=pil_font, fill=255, align='center')
+    
+    mask = np.asarray(img, dtype=np.float32) / 255
+    mask.setflags(write=False)
+    return mask
+
+
+def mask_clip(mask, color="#F5F5F5"):
+    """ImageClip of a flat colour frame shown through mask - text is one colour,
+    so only the mask carries per-pixel data"""
+    frame = np.empty(mask.shape + (3,), dtype=np.uint8)
+    frame[...] = ImageColor.getrgb(color)[:3]
+    return ImageClip(frame).set_mask(ImageClip(mask, ismask=True))
+
+
+def text_clip(text, font_size, color="#F5F5F5", font=None):
+    """Render centered text into an ImageClip"""
+    return mask_clip(render_text_mask(text, font_size, font), color)
+
+
+def stacked_clip(layers, color="#F5F5F5"):
+    """Flatten (mask, y offset) layers into one horizontally centered ImageClip,
+    so static elements that share timing cost one blit per frame instead of several"""
+    width = max(mask.shape[1] for mask, _ in layers)
+    height = max(y + mask.shape[0] for mask, y in layers)
+    
+    canvas = np.zeros((height, width), dtype=np.float32)
+    for mask, y in layers:
+        x = (width - mask.shape[1]) // 2
+        region = canvas[y:y + mask.shape[0], x:x + mask.shape[1]]
+        region += mask * (1 - region)  # alpha "over"
+    
+    return mask_clip(canvas, color)
+
+
+def get_background_video():
+    """Today's {Day}_bg.mp4 when present, else the configured background"""
+    day_bg = f"{DAY_NAMES[datetime.now(AUS_TZ).weekday()]}_bg.mp4"
+    if os.path.exists(day_bg):
+        return day_bg
+    return VIDEO_CONFIG['background_video']
+
+
+def prepare_background(path, target_w, target_h, duration):
+    """Scale/crop/loop the background to target size and duration with one ffmpeg call"""
+    prepped_path = os.path.join(
+        VIDEO_CONFIG['temp_folder'],
+        f"bg_prepped_{target_w}x{target_h}_{duration}_{os.path.basename(path)}"
+    )
+    
+    # Reuse an existing prep (e.g. made by the parent before the render pool started)
+    if os.path.exists(prepped_path) and os.path.getmtime(prepped_path) >= os.path.getmtime(path):
+        return prepped_path
+    
+    part_path = f"{prepped_path}.{os.getpid()}.part"
+    cmd = [
+        imageio_ffmpeg.get_ffmpeg_exe(), '-y', '-loglevel', 'error',
+        '-stream_loop', '-1', '-i', path,
+        '-vf', f"scale={target_w}:{target_h}:force_original_aspect_ratio=increase,"
+               f"crop={target_w}:{target_h},setsar=1",
+        '-t', str(duration),
+        '-r', str(SHORTS_CONFIG['fps']),
+        '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '18',
+        '-c:a', 'aac', '-b:a', '192k',
+        '-f', 'mp4', part_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg background prep failed: {result.stderr.strip()[-1000:]}")
+    os.replace(part_path, prepped_path)
+    
+    return prepped_path
+
+
+def prepare_music(path, duration, volume):
+    """Loop, trim and level the background music to duration with one ffmpeg call"""
+    base = os.path.splitext(os.path.basename(path))[0]
+    prepped_path = os.path.join(VIDEO_CONFIG['temp_folder'], f"music_prepped_{duration}_{volume}_{base}.m4a")
+    
+    if os.path.exists(prepped_path) and os.path.getmtime(prepped_path) >= os.path.getmtime(path):
+        return prepped_path
+    
+    part_path = f"{prepped_path}.{os.getpid()}.part"
+    cmd = [
+        imageio_ffmpeg.get_ffmpeg_exe(), '-y', '-loglevel', 'error',
+        '-stream_loop', '-1', '-i', path,
+        '-t', str(duration), '-vn',
+        '-af', f"volume={volume}",
+        '-c:a', 'aac', '-b:a', '192k',
+        '-f', 'mp4', part_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg music prep failed: {result.stderr.strip()[-1000:]}")
+    os.replace(part_path, prepped_path)
+    
+    return prepped_path
+
+
+@functools.lru_cache(maxsize=4)
+def load_background(path, target_w, target_h, duration):
+    """Load background (with its own audio) scaled/cropped to target size and looped to duration"""
+    return VideoFileClip(prepare_background(path, target_w, target_h, duration))
+
+
+def heading_layers(text, font_size):
+    """Heading text and its underline (100px lower) as (mask, y offset) layers"""
+    return [
+        (render_text_mask(text, font_size + 20, font='Arial-Bold'), 0),
+        (render_text_mask("━" * 20, font_size // 2), 100),
+    ]
+
+
+def create_heading(text, font_size, duration, fade=True):
+    """Create heading with underline as a single clip"""
+    heading = stacked_clip(heading_layers(text, font_size)).set_duration(duration)
     
     if fade:
         heading = heading.fadein(0.8).fadeout(0.8)
-        underline = underline.fadein(0.8).fadeout(0.8)
     
-    return heading, underline
+    return heading
+
+
+# Built once - textwrap.wrap() constructs a new TextWrapper on every call
+_CHUNK_WRAPPER = textwrap.TextWrapper(width=35)
 
 
 def create_text_chunks(text, font_size, screen_size, total_duration):
@@ -258,103 +616,90 @@ def create_text_chunks(text, font_size, screen_size, total_duration):
     wrapped_lines = []
     for line in text.split('\n'):
         if line.strip():
-            wrapped_lines.extend(textwrap.wrap(line, width=35))
+            wrapped_lines.extend(_CHUNK_WRAPPER.wrap(line))
     
     total_lines = len(wrapped_lines)
     
     if total_lines <= 8:
-        chunks = ["\n".join(wrapped_lines)]
+        chunk_groups = [wrapped_lines]
     elif total_lines <= 16:
-        mid = len(wrapped_lines) // 2
-        chunks = ["\n".join(wrapped_lines[:mid]), "\n".join(wrapped_lines[mid:])]
+        mid = total_lines // 2
+        chunk_groups = [wrapped_lines[:mid], wrapped_lines[mid:]]
     else:
         LINES_PER_CHUNK = 9
-        chunks = []
-        for i in range(0, len(wrapped_lines), LINES_PER_CHUNK):
-            chunk_lines = wrapped_lines[i:i + LINES_PER_CHUNK]
-            chunks.append("\n".join(chunk_lines))
+        chunk_groups = [wrapped_lines[i:i + LINES_PER_CHUNK] for i in range(0, total_lines, LINES_PER_CHUNK)]
+    
+    chunks = ["\n".join(lines) for lines in chunk_groups]
     
     text_clips = []
     
     if len(chunks) == 1:
-        clip = TextClip(
-            chunks[0],
-            fontsize=font_size,
-            color="#F5F5F5",
-            method='label',
-            align='center'
-        ).set_duration(total_duration).set_start(0).fadein(0.8).fadeout(0.8)
+        clip = text_clip(chunks[0], font_size).set_duration(total_duration).set_start(0).fadein(0.8).fadeout(0.8)
         text_clips.append(clip)
     else:
-        chunk_line_counts = [len(chunk.split('\n')) for chunk in chunks]
-        total_lines_all = sum(chunk_line_counts)
+        # Time on screen proportional to line count (at least 3s), back to back
+        # (plain lists - there are only two or three chunks, too few for numpy to pay off)
+        durations = [max(3.0, len(lines) / total_lines * total_duration) for lines in chunk_groups]
+        starts = itertools.accumulate(durations, initial=0.0)
         
-        current_time = 0
-        for i, chunk in enumerate(chunks):
-            lines_in_chunk = chunk_line_counts[i]
-            chunk_duration = max(3.0, (lines_in_chunk / total_lines_all) * total_duration)
-            
-            clip = TextClip(
-                chunk,
-                fontsize=font_size,
-                color="#F5F5F5",
-                method='label',
-                align='center'
-            ).set_duration(chunk_duration).set_start(current_time).fadein(0.8).fadeout(0.8)
-            
+        for chunk, start, chunk_duration in zip(chunks, starts, durations):
+            clip = text_clip(chunk, font_size).set_duration(chunk_duration).set_start(start).fadein(0.8).fadeout(0.8)
             text_clips.append(clip)
-            current_time += chunk_duration
     
     return text_clips
 
 
-def create_short(sign, content):
-    """Create video short"""
+def allocate_section_times(lengths, minimums, available):
+    """Split available whole seconds between sections in proportion to their text
+    length, never below each section's minimum and always summing to available"""
+    lengths = np.asarray(lengths, dtype=np.float64)
+    minimums = np.asarray(minimums, dtype=np.int64)
+    
+    total = lengths.sum()
+    props = lengths / total if total else minimums / minimums.sum()
+    
+    extra = available - minimums.sum()
+    alloc = minimums + np.floor(extra * props).astype(np.int64)
+    alloc[np.argmax(props)] += available - alloc.sum()
+    
+    return [int(t) for t in alloc]
+
+
+def moviepy_encoder_args(encoder):
+    """Split a (codec, params) pair from get_h264_encoder into MoviePy's codec,
+    preset and extra ffmpeg params. MoviePy always passes -preset, so encoders
+    without a preset of their own (VAAPI, VideoToolbox) fall back to libx264"""
+    codec, params = encoder
+    if '-preset' not in params:
+        return 'libx264', 'ultrafast', []
+    i = params.index('-preset')
+    return codec, params[i + 1], params[:i] + params[i + 2:]
+
+
+def create_short(sign, content, bg_path=None, encoder=None):
+    """Create video short over bg_path (default: configured background) with
+    encoder, a (codec, params) pair from get_h264_encoder (probed when omitted)"""
     print(f"  🎬 Creating video...")
     screen_size = SHORTS_CONFIG['resolution']
     
     # Calculate adaptive timing
-    horo_length = len(content['horoscope'])
-    wealth_length = len(content['wealth'])
-    health_length = len(content['health'])
-    total_content_length = horo_length + wealth_length + health_length
-    
     AVAILABLE_TIME = 54
     SUBSCRIBE_DURATION = 5
-    TARGET_DURATION = 59
+    TARGET_DURATION = SHORT_DURATION
     
-    horo_time = max(15, int((horo_length / total_content_length) * AVAILABLE_TIME))
-    wealth_time = max(12, int((wealth_length / total_content_length) * AVAILABLE_TIME))
-    health_time = max(12, AVAILABLE_TIME - horo_time - wealth_time)
+    horo_time, wealth_time, health_time = allocate_section_times(
+        [len(content['horoscope']), len(content['wealth']), len(content['health'])],
+        [15, 12, 12],
+        AVAILABLE_TIME
+    )
     
-    # Load and crop background
-    bg_original = VideoFileClip(VIDEO_CONFIG['background_video'])
+    # Background is cropped/looped once and shared by every sign
     target_w, target_h = screen_size
-    bg_w, bg_h = bg_original.size
-    
-    scale = target_h / bg_h
-    new_w = int(bg_w * scale)
-    
-    if new_w >= target_w:
-        bg_original = bg_original.resize(height=target_h)
-        x_center = bg_original.w / 2
-        x1 = int(x_center - target_w / 2)
-        bg_original = bg_original.crop(x1=x1, width=target_w)
-    else:
-        bg_original = bg_original.resize(width=target_w)
-        if bg_original.h > target_h:
-            y_center = bg_original.h / 2
-            y1 = int(y_center - target_h / 2)
-            bg_original = bg_original.crop(y1=y1, height=target_h)
+    bg_path = bg_path or VIDEO_CONFIG['background_video']
+    bg_clip = load_background(bg_path, target_w, target_h, TARGET_DURATION).copy()
     
     MAIN_DURATION = horo_time + wealth_time + health_time
     
-    if bg_original.duration < TARGET_DURATION:
-        loops = int(TARGET_DURATION / bg_original.duration) + 1
-        bg_clip = bg_original.loop(n=loops).subclip(0, TARGET_DURATION)
-    else:
-        bg_clip = bg_original.subclip(0, TARGET_DURATION)
-    
     all_clips = []
     current_time = 0
     
@@ -364,38 +709,20 @@ def create_short(sign, content):
     DATE_Y = SIGN_Y + 130
     HORO_HEADING_Y = HEADING_Y - 60
     
-    # Title
-    title_heading, title_underline = create_heading(
-        f"✨ {sign} ✨",
-        TEXT_STYLE['title_font_size'],
-        "#F5F5F5",
-        MAIN_DURATION,
-        screen_size,
-        fade=False
-    )
-    title_heading = title_heading.set_position(('center', SIGN_Y))
-    title_underline = title_underline.set_position(('center', SIGN_Y + 100))
-    all_clips.extend([title_heading, title_underline])
-    
-    date_clip = TextClip(
-        datetime.now().strftime("%d %b %Y"),
-        fontsize=35,
-        color="#F5F5F5",
-        method='label'
-    ).set_duration(MAIN_DURATION).set_position(('center', DATE_Y))
-    all_clips.append(date_clip)
+    # Title, underline and date never change - one layer for all three
+    title_layers = heading_layers(f"✨ {sign} ✨", TEXT_STYLE['title_font_size'])
+    title_layers.append((render_text_mask(RUN_DATE.strftime("%d %b %Y"), 35), DATE_Y - SIGN_Y))
+    title_clip = stacked_clip(title_layers).set_duration(MAIN_DURATION).set_position(('center', SIGN_Y))
+    all_clips.append(title_clip)
     
     # Horoscope
-    horo_heading, horo_underline = create_heading(
+    horo_heading = create_heading(
         "🌙 Daily Horoscope",
         TEXT_STYLE['content_font_size'],
-        "#F5F5F5",
-        horo_time,
-        screen_size
+        horo_time
     )
     horo_heading = horo_heading.set_position(('center', HORO_HEADING_Y)).set_start(current_time)
-    horo_underline = horo_underline.set_position(('center', HORO_HEADING_Y + 100)).set_start(current_time)
-    all_clips.extend([horo_heading, horo_underline])
+    all_clips.append(horo_heading)
     
     horo_chunks = create_text_chunks(content['horoscope'], TEXT_STYLE['content_font_size'] - 5, screen_size, horo_time)
     for chunk in horo_chunks:
@@ -415,13 +742,11 @@ def create_short(sign, content):
     current_time += health_time
     
     # Subscribe
-    sub_text = TextClip(
+    sub_text = text_clip(
         "🔔 SUBSCRIBE\n\nLIKE • SHARE • COMMENT",
-        fontsize=60,
+        60,
         color="#FFD700",
-        font='Arial-Bold',
-        method='label',
-        align='center'
+        font='Arial-Bold'
     ).set_duration(SUBSCRIBE_DURATION).set_position('center').set_start(current_time).fadein(0.5)
     all_clips.append(sub_text)
     
@@ -430,49 +755,50 @@ def create_short(sign, content):
     
     # Add music
     if os.path.exists(VIDEO_CONFIG['background_music']):
-        music = AudioFileClip(VIDEO_CONFIG['background_music']).volumex(VIDEO_CONFIG['music_volume'])
-        if music.duration < TARGET_DURATION:
-            loops = int(TARGET_DURATION / music.duration) + 1
-            music = music.loop(n=loops).subclip(0, TARGET_DURATION)
-        else:
-            music = music.subclip(0, TARGET_DURATION)
-        final_video = final_video.set_audio(music)
+        music_path = prepare_music(VIDEO_CONFIG['background_music'], TARGET_DURATION, VIDEO_CONFIG['music_volume'])
+        final_video = final_video.set_audio(AudioFileClip(music_path))
     
     output_file = os.path.join(
         VIDEO_CONFIG['output_folder'], 
         'youtube_shorts', 
-        f"{sign}_{datetime.now().strftime('%Y%m%d')}.mp4"
+        f"{sign}_{RUN_DATE.strftime('%Y%m%d')}.mp4"
     )
     
-    final_video.write_videofile(
-        output_file, 
-        fps=SHORTS_CONFIG['fps'],
-        codec='libx264',
-        audio_codec='aac',
-        preset='ultrafast',
-        threads=4,
-        logger=None
+    # MoviePy hands ffmpeg RGB frames, so the output filter picks the pixel format
+    codec, preset, codec_params = moviepy_encoder_args(
+        encoder or get_h264_encoder(imageio_ffmpeg.get_ffmpeg_exe())
     )
+    try:
+        final_video.write_videofile(
+            output_file, 
+            fps=SHORTS_CONFIG['fps'],
+            codec=codec,
+            audio_codec='aac',
+            preset=preset,
+            ffmpeg_params=['-vf', output_filter(codec), *codec_params],
+            threads=RENDER_THREADS,
+            logger=None
+        )
+    finally:
+        # Closes the music reader even when the encode fails, so a long-lived
+        # render worker does not pile up ffmpeg readers (background stays open
+        # in the load_background cache)
+        final_video.close()
     
     print(f"  ✅ Video created")
     
-    # Cleanup
-    bg_original.close()
-    bg_clip.close()
-    final_video.close()
-    
     return output_file
 
 
 # ========================================
-# MAIN - ONE AT A TIME
+# MAIN - PARALLEL RENDER, SEQUENTIAL UPLOAD
 # ========================================
 
 def main():
     print("="*60)
     print("🌟 ASTROFINANCE DAILY - GENERATE → UPLOAD → DELETE")
     print("="*60)
-    print(f"📅 {datetime.now().strftime('%B %d, %Y')}")
+    print(f"📅 {RUN_DATE.strftime('%B %d, %Y')}")
     print("="*60)
     
     # Check credentials
@@ -490,55 +816,80 @@ def main():
         print("⚠️ YouTube: Not configured - videos will be saved locally")
         auto_upload = False
     
-    print("\n🔄 Processing one sign at a time...")
+    print(f"\n🔄 Rendering with {RENDER_WORKERS} worker process(es), uploading one at a time...")
     print("="*60)
     
     results = []
     
-    for i, sign in enumerate(ZODIAC_SIGNS, 1):
-        print(f"\n[{i}/12] 🔮 {sign}")
-        print("-" * 40)
+    # Step 1: Generate content for every sign on a background thread - it is all
+    # network wait, so the ffmpeg media prep below runs underneath it
+    with ThreadPoolExecutor(max_workers=1) as fetcher:
+        contents_future = fetcher.submit(get_content_for_signs, ZODIAC_SIGNS)
         
+        # Pick and prep the shared background once so workers only have to open it
+        bg_path = get_background_video()
+        print(f"\n🎞️ Background: {bg_path}")
         try:
-            # Step 1: Generate content
-            content = get_content_for_sign(sign)
-            
-            # Step 2: Create video
-            video_path = create_short(sign, content)
-            
-            # Step 3: Upload to YouTube (if configured)
-            youtube_url = None
-            if auto_upload:
-                youtube_url = upload_to_youtube(video_path, sign)
-                
-                # Wait 30 seconds between uploads to avoid rate limits
-                if youtube_url and i < len(ZODIAC_SIGNS):
-                    print(f"    ⏳ Waiting 30s before next upload...")
-                    time.sleep(30)
-            
-            # Step 4: Delete video file to save space
+            target_w, target_h = SHORTS_CONFIG['resolution']
+            prepare_background(bg_path, target_w, target_h, SHORT_DURATION)
+        except Exception as e:
+            print(f"⚠️ Background prep failed, workers will retry: {e}")
+        
+        if os.path.exists(VIDEO_CONFIG['background_music']):
             try:
-                os.remove(video_path)
-                print(f"  🗑️ Local file deleted")
-            except:
-                print(f"  ⚠️ Could not delete local file")
-            
-            # Track results
-            results.append({
-                'sign': sign,
-                'success': True,
-                'youtube_url': youtube_url
-            })
-            
-            print(f"  ✅ {sign} complete!")
+                prepare_music(VIDEO_CONFIG['background_music'], SHORT_DURATION, VIDEO_CONFIG['music_volume'])
+            except Exception as e:
+                print(f"⚠️ Music prep failed, workers will retry: {e}")
+        
+        # Probe the encoder here once instead of in every worker process
+        encoder = get_h264_encoder(imageio_ffmpeg.get_ffmpeg_exe())
+        
+        contents = contents_future.result()
+    
+    # Step 2: Render all signs in worker processes (each runs its own ffmpeg)
+    with ProcessPoolExecutor(max_workers=RENDER_WORKERS) as executor:
+        futures = [executor.submit(create_short, sign, contents[sign], bg_path, encoder) for sign in ZODIAC_SIGNS]
+        
+        for i, (sign, future) in enumerate(zip(ZODIAC_SIGNS, futures), 1):
+            print(f"\n[{i}/12] 🔮 {sign}")
+            print("-" * 40)
             
-        except Exception as e:
-            print(f"  ❌ {sign} failed: {e}")
-            results.append({
-                'sign': sign,
-                'success': False,
-                'error': str(e)
-            })
+            try:
+                video_path = future.result()
+                
+                # Step 3: Upload to YouTube (if configured)
+                youtube_url = None
+                if auto_upload:
+                    youtube_url = upload_to_youtube(video_path, sign)
+                    
+                    # Wait 30 seconds between uploads to avoid rate limits
+                    if youtube_url and i < len(ZODIAC_SIGNS):
+                        print(f"    ⏳ Waiting 30s before next upload...")
+                        time.sleep(30)
+                
+                # Step 4: Delete video file to save space
+                try:
+                    os.remove(video_path)
+                    print(f"  🗑️ Local file deleted")
+                except:
+                    print(f"  ⚠️ Could not delete local file")
+                
+                # Track results
+                results.append({
+                    'sign': sign,
+                    'success': True,
+                    'youtube_url': youtube_url
+                })
+                
+                print(f"  ✅ {sign} complete!")
+                
+            except Exception as e:
+                print(f"  ❌ {sign} failed: {e}")
+                results.append({
+                    'sign': sign,
+                    'success': False,
+                    'error': str(e)
+                })
     
     # Summary
     print("\n" + "="*60)